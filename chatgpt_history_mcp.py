@@ -12,18 +12,28 @@ Usage:
     python chatgpt_history_mcp.py --export-path /path/to/chatgpt-export.zip
 """
 
+import hashlib
+import heapq
 import json
 import math
 import os
+import pickle
 import re
 import sys
+import time
 import zipfile
+import zlib
+from array import array
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import ijson
 from mcp.server.fastmcp import FastMCP
 from mcp.types import Icon
 from pydantic import BaseModel, Field, ConfigDict
@@ -33,9 +43,30 @@ from pydantic import BaseModel, Field, ConfigDict
 # Data models
 # ===========================================================================
 
-@dataclass
+# Dates are rendered from time.gmtime with %-formatting: far cheaper than
+# datetime.fromtimestamp(...).strftime(...) when formatting every message.
+
+def _format_datetime(ts: float) -> str:
+    """Format a Unix timestamp as 'YYYY-MM-DD HH:MM UTC'."""
+    tm = time.gmtime(ts)
+    return "%04d-%02d-%02d %02d:%02d UTC" % (tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min)
+
+
+def _format_date(ts: float) -> str:
+    """Format a Unix timestamp as 'YYYY-MM-DD' (UTC)."""
+    tm = time.gmtime(ts)
+    return "%04d-%02d-%02d" % (tm.tm_year, tm.tm_mon, tm.tm_mday)
+
+
+def _format_month(ts: float) -> str:
+    """Format a Unix timestamp as 'YYYY-MM' (UTC)."""
+    tm = time.gmtime(ts)
+    return "%04d-%02d" % (tm.tm_year, tm.tm_mon)
+
+
+@dataclass(slots=True)
 class Message:
-    """A single message in a conversation."""
+    """A single message in a conversation (a view built by Conversation.iter_messages)."""
     role: str          # "user", "assistant", "system", "tool"
     text: str
     timestamp: Optional[float] = None
@@ -43,48 +74,103 @@ class Message:
     @property
     def date_str(self) -> str:
         if self.timestamp:
-            return datetime.fromtimestamp(self.timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+            return _format_datetime(self.timestamp)
         return ""
 
 
-@dataclass
+# Longest preview kept uncompressed alongside packed message texts
+_PREVIEW_CHARS = 300
+
+
+@dataclass(slots=True)
 class Conversation:
-    """A parsed ChatGPT conversation."""
+    """A parsed ChatGPT conversation.
+
+    Messages are stored column-wise in parallel lists rather than as one
+    object per message; use iter_messages() to walk them as Message views.
+
+    Once indexed, the message texts are compressed with pack() and only
+    inflated again when something reads `texts`. The start of the preview
+    is kept uncompressed so search results don't have to inflate anything.
+    """
     id: str
     title: str
     create_time: Optional[float] = None
     update_time: Optional[float] = None
-    messages: list[Message] = field(default_factory=list)
     model_slug: str = ""
+    roles: list[str] = field(default_factory=list)
+    timestamps: array = field(default_factory=lambda: array("d"))  # NaN when missing
+    _texts: Optional[list[str]] = field(default_factory=list, repr=False)  # None once packed
+    _packed_texts: bytes = field(default=b"", repr=False)
+    _preview_head: str = field(default="", repr=False)  # first _PREVIEW_CHARS + 1 chars, once packed
+
+    def add_message(self, role: str, text: str, timestamp: Optional[float] = None):
+        # Roles repeat on every message; interning shares one str per role
+        self.roles.append(sys.intern(role))
+        self._texts.append(text)
+        self.timestamps.append(math.nan if timestamp is None else timestamp)
+
+    @property
+    def texts(self) -> list[str]:
+        """Message texts, inflated from the packed form if needed. Do not mutate."""
+        if self._texts is not None:
+            return self._texts
+        return _unpack_texts(self._packed_texts)
+
+    def pack(self):
+        """Compress the message texts in memory; they stay readable through `texts`."""
+        if self._texts is not None:
+            # One extra char is enough to tell whether a preview was cut short
+            self._preview_head = self._user_text()[:_PREVIEW_CHARS + 1]
+            # Level 1: this runs over the whole export on every cold start, and
+            # higher levels cost several times longer for ~15% smaller output
+            # surrogatepass: exports can hold lone surrogates (e.g. a truncated
+            # emoji) that strict UTF-8 rejects; json.loads reads them back as-is
+            raw = json.dumps(self._texts, ensure_ascii=False).encode("utf-8", "surrogatepass")
+            self._packed_texts = zlib.compress(raw, 1)
+            self._texts = None
+
+    def iter_messages(self) -> Iterator[Message]:
+        for role, text, ts in zip(self.roles, self.texts, self.timestamps):
+            yield Message(role=role, text=text, timestamp=None if math.isnan(ts) else ts)
 
     @property
     def date_str(self) -> str:
         ts = self.create_time or self.update_time
         if ts:
-            return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+            return _format_date(ts)
         return "unknown date"
 
     @property
     def message_count(self) -> int:
-        return len(self.messages)
+        return len(self.roles)
 
-    @property
-    def full_text(self) -> str:
-        """All message text concatenated (for search indexing)."""
-        parts = [self.title]
-        for m in self.messages:
-            parts.append(m.text)
-        return " ".join(parts)
+    def iter_tokens(self) -> Iterator[list[bytes]]:
+        """Yield the tokens of the title, then of each message (for search indexing)."""
+        yield _tokenize(self.title)
+        for text in self.texts:
+            yield _tokenize(text)
+
+    def _user_text(self) -> str:
+        return " | ".join(text for role, text in zip(self.roles, self.texts) if role == "user")
 
     def preview(self, max_chars: int = 300) -> str:
         """Short preview of the conversation content."""
-        user_msgs = [m.text for m in self.messages if m.role == "user"]
-        preview_text = " | ".join(user_msgs)
+        if self._texts is None and max_chars <= _PREVIEW_CHARS:
+            preview_text = self._preview_head
+        else:
+            preview_text = self._user_text()
         if len(preview_text) > max_chars:
             preview_text = preview_text[:max_chars] + "…"
         return preview_text
 
 
+@lru_cache(maxsize=32)
+def _unpack_texts(packed: bytes) -> list[str]:
+    """Inflate packed message texts, keeping recently read conversations hot."""
+    return json.loads(zlib.decompress(packed))
+
+
 # ===========================================================================
 # ChatGPT export parser
 # ===========================================================================
@@ -96,64 +182,34 @@ def parse_chatgpt_export(export_path: str) -> list[Conversation]:
     ChatGPT exports contain a conversations.json with a tree structure
     (mapping of node IDs). We flatten each tree into a linear conversation.
     """
-    path = Path(export_path)
-    raw_json = None
-
-    # Detect ZIP by magic bytes (PK\x03\x04) so a misnamed file still works.
-    with open(path, "rb") as _f:
-        _magic = _f.read(4)
-    is_zip = _magic[:2] == b"PK"
-
-    if is_zip:
-        with zipfile.ZipFile(path, "r") as zf:
-            names = zf.namelist()
-            # New format: conversations split across conversations-000.json, -001.json, etc.
-            parts = sorted(n for n in names if re.match(r"conversations-\d+\.json", n))
-            if parts:
-                raw_json = []
-                for name in parts:
-                    chunk = json.loads(zf.read(name))
-                    raw_json.extend(entry for entry in chunk if entry)
-            else:
-                # Old format: single conversations.json
-                for name in names:
-                    if name == "conversations.json":
-                        raw_json = json.loads(zf.read(name))
-                        break
-        if raw_json is None:
-            raise FileNotFoundError("No conversations.json found in the ZIP file.")
-    else:
-        raw_json = json.loads(path.read_text(encoding="utf-8"))
-
     conversations: list[Conversation] = []
 
-    for entry in raw_json:
+    for entry in _iter_export_entries(Path(export_path)):
         conv = Conversation(
             id=entry.get("id", entry.get("conversation_id", "")),
             title=entry.get("title", "Untitled"),
             create_time=entry.get("create_time"),
             update_time=entry.get("update_time"),
-            model_slug=entry.get("default_model_slug", ""),
+            model_slug=sys.intern(entry.get("default_model_slug") or ""),
         )
 
         # Flatten the message tree
         mapping = entry.get("mapping", {})
         if mapping:
-            messages = _flatten_message_tree(mapping)
-            conv.messages = messages
+            _flatten_message_tree(mapping, conv)
         else:
             # Some exports have a flat "messages" array
             for msg in entry.get("messages", []):
                 if msg and msg.get("content"):
                     text = _extract_text(msg["content"])
                     if text.strip():
-                        conv.messages.append(Message(
-                            role=msg.get("role", msg.get("author", {}).get("role", "unknown")),
+                        conv.add_message(
+                            role=msg.get("role") or (msg.get("author") or {}).get("role") or "unknown",
                             text=text,
                             timestamp=msg.get("create_time"),
-                        ))
+                        )
 
-        if conv.messages:
+        if conv.roles:
             conversations.append(conv)
 
     # Sort newest first
@@ -161,10 +217,47 @@ def parse_chatgpt_export(export_path: str) -> list[Conversation]:
     return conversations
 
 
-def _flatten_message_tree(mapping: dict) -> list[Message]:
+def _iter_export_entries(path: Path) -> Iterator[dict]:
+    """
+    Stream the raw conversation objects out of an export, one at a time.
+
+    The JSON arrays are parsed incrementally with ijson, so memory use is
+    bounded by the largest single conversation rather than the whole file.
     """
-    Convert ChatGPT's tree-structured mapping into a flat list of messages.
+    # Detect ZIP by magic bytes (PK\x03\x04) so a misnamed file still works.
+    with open(path, "rb") as _f:
+        _magic = _f.read(4)
+    is_zip = _magic[:2] == b"PK"
+
+    if not is_zip:
+        with open(path, "rb") as fh:
+            yield from (entry for entry in ijson.items(fh, "item", use_float=True) if entry)
+        return
+
+    with zipfile.ZipFile(path, "r") as zf:
+        names = zf.namelist()
+        # New format: conversations split across conversations-000.json, -001.json, etc.
+        parts = sorted(n for n in names if re.match(r"conversations-\d+\.json", n))
+        if not parts:
+            # Old format: single conversations.json
+            if "conversations.json" not in names:
+                raise FileNotFoundError("No conversations.json found in the ZIP file.")
+            parts = ["conversations.json"]
+        for name in parts:
+            with zf.open(name) as fh:
+                yield from (entry for entry in ijson.items(fh, "item", use_float=True) if entry)
+
+
+_MESSAGE_ROLES = frozenset(("user", "assistant", "system", "tool"))
+
+
+def _flatten_message_tree(mapping: dict, conv: Conversation):
+    """
+    Flatten ChatGPT's tree-structured mapping into the messages of `conv`.
     Follows the main branch (first child at each node).
+
+    This runs once per conversation on every cold start, so lookups are
+    bound to locals and the cheap role check runs before text extraction.
     """
     # Find the root node (no parent or parent not in mapping)
     root_id = None
@@ -175,40 +268,51 @@ def _flatten_message_tree(mapping: dict) -> list[Message]:
             break
 
     if root_id is None:
-        return []
+        return
+
+    get_node = mapping.get
+    add_message = conv.add_message
+    roles = _MESSAGE_ROLES
 
     # Walk the tree depth-first following first child
-    messages: list[Message] = []
     current_id = root_id
 
     while current_id:
-        node = mapping.get(current_id, {})
+        node = get_node(current_id)
+        if node is None:
+            break
         msg_data = node.get("message")
 
-        if msg_data and msg_data.get("content"):
-            author = msg_data.get("author", {}).get("role", "unknown")
-            text = _extract_text(msg_data["content"])
-
-            if text.strip() and author in ("user", "assistant", "system", "tool"):
-                messages.append(Message(
-                    role=author,
-                    text=text,
-                    timestamp=msg_data.get("create_time"),
-                ))
+        if msg_data:
+            content = msg_data.get("content")
+            author = msg_data.get("author")
+            role = author.get("role", "unknown") if author else "unknown"
+            if content and role in roles:
+                text = _extract_text(content)
+                if text.strip():
+                    add_message(role, text, msg_data.get("create_time"))
 
         # Follow first child
-        children = node.get("children", [])
+        children = node.get("children")
         current_id = children[0] if children else None
 
-    return messages
-
 
 def _extract_text(content: dict) -> str:
     """Extract readable text from a ChatGPT message content object."""
     if isinstance(content, str):
         return content
 
-    parts = content.get("parts", [])
+    parts = content.get("parts") or ()
+
+    # Fast path: most messages have exactly one part, so skip the list + join
+    if len(parts) == 1:
+        part = parts[0]
+        if isinstance(part, str):
+            return part
+        if isinstance(part, dict):
+            return part.get("text", "")
+        return ""
+
     texts = []
     for part in parts:
         if isinstance(part, str):
@@ -221,51 +325,94 @@ def _extract_text(content: dict) -> str:
 
 
 # ===========================================================================
-# Search engine (TF-IDF + keyword)
+# Search engine (BM25 + keyword)
 # ===========================================================================
 
+# Byte translation table for the tokenizer: ASCII letters are lowercased,
+# digits kept, and every other byte becomes a space.
+_TOKEN_TABLE = bytes(
+    c + 32 if 65 <= c <= 90 else c if 97 <= c <= 122 or 48 <= c <= 57 else 32
+    for c in range(256)
+)
+
+
+def _tokenize(text: str) -> list[bytes]:
+    """Simple tokenizer: lowercase, split on non-alphanumeric.
+
+    Equivalent to findall(r"[a-z0-9]+") on the lowercased text, but done
+    as one C-level translate + split over ASCII bytes. Non-ASCII text is
+    lowercased first, since some characters lowercase into ASCII letters
+    (e.g. "İ" -> "i", the Kelvin sign -> "k"); the rest become "?" and
+    act as separators.
+    """
+    if not text.isascii():
+        text = text.lower()
+    return text.encode("ascii", "replace").translate(_TOKEN_TABLE).split()
+
+
+def _count_terms(conversations: list[Conversation]) -> list[Counter]:
+    """Term frequencies of each conversation."""
+    # One Counter per conversation, fed by a single flattened generator so
+    # counting happens in Counter's C loop rather than per-message updates
+    return [Counter(chain.from_iterable(conv.iter_tokens())) for conv in conversations]
+
+
 class SearchEngine:
     """
-    Lightweight search engine using TF-IDF scoring.
+    Lightweight search engine using Okapi BM25 scoring.
     No external dependencies needed — works on pure Python.
+
+    Postings are stored column-wise per term as two packed arrays
+    (conversation indices and precomputed BM25 weights), so a query
+    only touches the postings of its own terms. Weights are quantized to
+    16-bit fixed point relative to the largest weight the term can reach.
     """
 
+    K1 = 1.2   # term-frequency saturation
+    B = 0.75   # document-length normalization
+
+    _QUANT_MAX = 0xFFFF  # largest uint16 posting weight
+
     def __init__(self, conversations: list[Conversation]):
         self.conversations = conversations
-        self._index: dict[str, list[tuple[int, float]]] = {}  # term -> [(conv_idx, tf)]
-        self._idf: dict[str, float] = {}
+        self._index: dict[bytes, tuple[array, array, float]] = {}  # term -> (conv_idxs, quantized weights, scale)
+        # Packed creation times aligned with conversations, for date filtering (0 when missing)
+        self._create_times = array("d", (c.create_time or 0 for c in conversations))
+        self._titles_lower = [c.title.lower() for c in conversations]
         self._build_index()
 
-    def _tokenize(self, text: str) -> list[str]:
-        """Simple tokenizer: lowercase, split on non-alphanumeric."""
-        return re.findall(r"[a-z0-9]+", text.lower())
-
     def _build_index(self):
-        """Build inverted index with TF-IDF scores."""
+        """Build inverted index with BM25 weights."""
         doc_freq: Counter = Counter()
         n_docs = len(self.conversations)
 
         # Compute term frequencies per document
-        tf_per_doc: list[Counter] = []
-        for conv in self.conversations:
-            tokens = self._tokenize(conv.full_text)
-            tf = Counter(tokens)
-            tf_per_doc.append(tf)
-            for term in set(tokens):
-                doc_freq[term] += 1
-
-        # Compute IDF
-        for term, df in doc_freq.items():
-            self._idf[term] = math.log((n_docs + 1) / (df + 1)) + 1
-
-        # Build inverted index with TF-IDF
+        tf_per_doc = _count_terms(self.conversations)
+        for tf in tf_per_doc:
+            if tf:
+                doc_freq.update(tf.keys())  # +1 per unique term
+
+        idf = {term: math.log((n_docs - df + 0.5) / (df + 0.5) + 1) for term, df in doc_freq.items()}
+        doc_len = [sum(tf.values()) for tf in tf_per_doc]
+        avg_len = sum(doc_len) / n_docs if n_docs else 0.0
+        k1, b = self.K1, self.B
+
+        # Build inverted index. Document lengths and IDF are fixed once the
+        # corpus is known, so each posting stores its final BM25 weight,
+        # idf * count * (k1 + 1) / (count + length_norm). That is below
+        # idf * (k1 + 1), so with that bound as the term's scale the posting
+        # only needs count / (count + length_norm) in uint16 fixed point.
+        # Every posting keeps at least 1 so a matching document never scores 0.
+        quant_max = self._QUANT_MAX
+        index = self._index
         for idx, tf in enumerate(tf_per_doc):
-            total_tokens = sum(tf.values()) or 1
+            length_norm = k1 * (1 - b + b * doc_len[idx] / avg_len) if avg_len else k1
             for term, count in tf.items():
-                normalized_tf = count / total_tokens
-                if term not in self._index:
-                    self._index[term] = []
-                self._index[term].append((idx, normalized_tf))
+                postings = index.get(term)
+                if postings is None:
+                    postings = index[term] = (array("I"), array("H"), idf[term] * (k1 + 1) / quant_max)
+                postings[0].append(idx)
+                postings[1].append(max(1, round(count * quant_max / (count + length_norm))))
 
     def search(
         self,
@@ -278,44 +425,54 @@ class SearchEngine:
         Search conversations by query string.
         Returns list of (conversation, score) tuples, sorted by relevance.
         """
-        query_tokens = self._tokenize(query)
+        query_tokens = _tokenize(query)
         if not query_tokens:
             return []
 
         # Score each document
         scores: dict[int, float] = {}
         for token in query_tokens:
-            idf = self._idf.get(token, 0)
-            for idx, tf in self._index.get(token, []):
-                scores[idx] = scores.get(idx, 0) + tf * idf
+            postings = self._index.get(token)
+            if postings is None:
+                continue
+            idxs, quantized, scale = postings
+            for idx, q in zip(idxs, quantized):
+                scores[idx] = scores.get(idx, 0) + q * scale
 
-        # Boost exact title matches
+        # Boost exact title matches. Only scored documents can gain from the
+        # doubling, so there is no need to scan every title.
         query_lower = query.lower()
-        for idx, conv in enumerate(self.conversations):
-            if query_lower in conv.title.lower():
-                scores[idx] = scores.get(idx, 0) * 2.0
+        titles_lower = self._titles_lower
+        for idx in scores:
+            if query_lower in titles_lower[idx]:
+                scores[idx] *= 2.0
 
         # Apply date filters
-        results = []
         ts_from = _parse_date(date_from) if date_from else None
         ts_to = _parse_date(date_to) if date_to else None
 
-        for idx, score in sorted(scores.items(), key=lambda x: x[1], reverse=True):
-            conv = self.conversations[idx]
-            ts = conv.create_time or 0
+        candidates = scores.items()
+        if ts_from or ts_to:
+            create_times = self._create_times
+            candidates = [(idx, score) for idx, score in candidates
+                          if _in_range(create_times[idx], ts_from, ts_to)]
 
-            if ts_from and ts < ts_from:
-                continue
-            if ts_to and ts > ts_to:
-                continue
-
-            results.append((conv, score))
-            if len(results) >= limit:
-                break
+        # Partial top-k selection instead of sorting every matched document
+        top = heapq.nlargest(limit, candidates, key=lambda x: x[1])
+        results = [(self.conversations[idx], score) for idx, score in top]
 
         return results
 
 
+def _in_range(ts: float, ts_from: Optional[float], ts_to: Optional[float]) -> bool:
+    """Check a timestamp against optional inclusive date bounds."""
+    if ts_from and ts < ts_from:
+        return False
+    if ts_to and ts > ts_to:
+        return False
+    return True
+
+
 def _parse_date(date_str: str) -> Optional[float]:
     """Parse a date string like '2024-01-15' into a Unix timestamp."""
     try:
@@ -329,17 +486,117 @@ def _parse_date(date_str: str) -> Optional[float]:
 # MCP Server
 # ===========================================================================
 
+@dataclass(slots=True)
+class UsageStats:
+    """Aggregates reported by chatgpt_stats, computed once per load."""
+    total_conversations: int
+    total_messages: int
+    earliest: str
+    latest: str
+    top_models: list[tuple[str, int]]     # at most 10, most used first
+    recent_months: list[tuple[str, int]]  # at most 12 "YYYY-MM", newest first
+
+
+def _compute_stats(conversations: list[Conversation]) -> UsageStats:
+    """Aggregate usage statistics in a single pass over the conversations."""
+    model_counts: Counter = Counter()
+    monthly: Counter = Counter()
+    total_msgs = 0
+    earliest = latest = None
+
+    for c in conversations:
+        total_msgs += c.message_count
+        model_counts[c.model_slug or "unknown"] += 1
+        ts = c.create_time
+        if ts:
+            if earliest is None or ts < earliest:
+                earliest = ts
+            if latest is None or ts > latest:
+                latest = ts
+            monthly[_format_month(ts)] += 1
+
+    return UsageStats(
+        total_conversations=len(conversations),
+        total_messages=total_msgs,
+        earliest=_format_date(earliest) if earliest is not None else "unknown",
+        latest=_format_date(latest) if latest is not None else "unknown",
+        top_models=heapq.nlargest(10, model_counts.items(), key=itemgetter(1)),
+        recent_months=heapq.nlargest(12, monthly.items()),
+    )
+
+
 # Global state — initialized on startup
 _conversations: list[Conversation] = []
+_conv_by_id: dict[str, Conversation] = {}
 _engine: Optional[SearchEngine] = None
+_stats: Optional[UsageStats] = None
+
+
+# Bump whenever Conversation or SearchEngine change shape, so stale caches are ignored
+_CACHE_VERSION = 10
+
+
+def _cache_path(export_path: str) -> Path:
+    """Location of the on-disk index cache for an export (one file per export)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha1(str(Path(export_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "chatgpt-history-mcp" / f"index-{key}.pkl"
+
+
+def _cache_fingerprint(export_path: str) -> tuple:
+    """Identify the export contents a cache was built from."""
+    st = os.stat(export_path)
+    return (_CACHE_VERSION, st.st_size, st.st_mtime_ns)
+
+
+def _load_cached_engine(cache_path: Path, fingerprint: tuple) -> Optional[SearchEngine]:
+    """Return the cached search engine if it was built from this exact export."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_fingerprint, engine = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        print(f"⚠️ Ignoring unreadable index cache: {exc}", file=sys.stderr)
+        return None
+    if cached_fingerprint != fingerprint:
+        return None
+    return engine
+
+
+def _save_cached_engine(cache_path: Path, fingerprint: tuple, engine: SearchEngine):
+    """Write the search engine to the cache, replacing any previous version atomically."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((fingerprint, engine), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        print(f"⚠️ Could not write index cache: {exc}", file=sys.stderr)
+        tmp_path.unlink(missing_ok=True)
 
 
 def _init_from_path(export_path: str):
-    """Parse the export and build the search index."""
-    global _conversations, _engine
+    """Parse the export and build the search index, reusing the on-disk cache when fresh."""
+    global _conversations, _conv_by_id, _engine, _stats
     print(f"📂 Loading ChatGPT export from: {export_path}", file=sys.stderr)
-    _conversations = parse_chatgpt_export(export_path)
-    _engine = SearchEngine(_conversations)
+    cache_path = _cache_path(export_path)
+    fingerprint = _cache_fingerprint(export_path)
+    engine = _load_cached_engine(cache_path, fingerprint)
+    if engine is None:
+        engine = SearchEngine(parse_chatgpt_export(export_path))
+        # Search only needs the index; keep full message texts compressed
+        for conv in engine.conversations:
+            conv.pack()
+        _save_cached_engine(cache_path, fingerprint, engine)
+    else:
+        print("⚡ Reusing cached index", file=sys.stderr)
+    _engine = engine
+    _conversations = engine.conversations
+    # Reversed so the first conversation wins if an export repeats an ID
+    _conv_by_id = {c.id: c for c in reversed(_conversations)}
+    _stats = _compute_stats(_conversations)
     print(f"✅ Indexed {len(_conversations)} conversations", file=sys.stderr)
 
 
@@ -495,9 +752,7 @@ async def chatgpt_get_conversation(params: GetConversationInput) -> str:
     if conv is None:
         return f"Error: Conversation with ID '{params.conversation_id}' not found."
 
-    messages = conv.messages
-    if params.max_messages:
-        messages = messages[:params.max_messages]
+    messages = list(islice(conv.iter_messages(), params.max_messages))
 
     lines = [
         f"## {conv.title}",
@@ -514,7 +769,7 @@ async def chatgpt_get_conversation(params: GetConversationInput) -> str:
         lines.append(msg.text)
         lines.append("")
 
-    truncated = len(conv.messages) - len(messages)
+    truncated = conv.message_count - len(messages)
     if truncated > 0:
         lines.append(f"*… {truncated} more messages not shown. Increase max_messages to see more.*")
 
@@ -584,39 +839,21 @@ async def chatgpt_stats() -> str:
     if not _conversations:
         return "No conversations loaded."
 
-    total_convs = len(_conversations)
-    total_msgs = sum(c.message_count for c in _conversations)
-
-    dates = [c.create_time for c in _conversations if c.create_time]
-    earliest = datetime.fromtimestamp(min(dates), tz=timezone.utc).strftime("%Y-%m-%d") if dates else "unknown"
-    latest = datetime.fromtimestamp(max(dates), tz=timezone.utc).strftime("%Y-%m-%d") if dates else "unknown"
-
-    # Model distribution
-    model_counts: Counter = Counter()
-    for c in _conversations:
-        model_counts[c.model_slug or "unknown"] += 1
-
-    # Monthly distribution
-    monthly: Counter = Counter()
-    for c in _conversations:
-        if c.create_time:
-            month = datetime.fromtimestamp(c.create_time, tz=timezone.utc).strftime("%Y-%m")
-            monthly[month] += 1
-
+    stats = _stats
     lines = [
         "## ChatGPT Usage Statistics\n",
-        f"- **Total conversations**: {total_convs:,}",
-        f"- **Total messages**: {total_msgs:,}",
-        f"- **Date range**: {earliest} → {latest}",
+        f"- **Total conversations**: {stats.total_conversations:,}",
+        f"- **Total messages**: {stats.total_messages:,}",
+        f"- **Date range**: {stats.earliest} → {stats.latest}",
         "",
         "### Model Usage",
     ]
-    for model, count in model_counts.most_common(10):
+    for model, count in stats.top_models:
         lines.append(f"- {model}: {count:,} conversations")
 
     lines.append("")
     lines.append("### Monthly Activity (last 12 months)")
-    for month, count in sorted(monthly.items(), reverse=True)[:12]:
+    for month, count in stats.recent_months:
         bar = "█" * min(count, 50)
         lines.append(f"- {month}: {bar} ({count})")
 
@@ -627,10 +864,7 @@ async def chatgpt_stats() -> str:
 
 def _find_conversation(conv_id: str) -> Optional[Conversation]:
     """Find a conversation by ID."""
-    for conv in _conversations:
-        if conv.id == conv_id:
-            return conv
-    return None
+    return _conv_by_id.get(conv_id)
 
 
 # ===========================================================================
@@ -2,13 +2,29 @@
 ChatGPT History for Claude — Installer
 A one-click GUI to set up the MCP server in Claude Desktop.
 """
+import copy
+import fcntl
+import hashlib
 import json
-import shutil
-import subprocess
-import threading
-import tkinter as tk
+import os
+import re
+import select
+import signal
+import stat
+import sys
+import time
+import zipfile
+from functools import lru_cache
 from pathlib import Path
-from tkinter import filedialog, messagebox
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is plenty for a small config
+    orjson = None
+
+# tkinter, subprocess and shutil are imported where they are used: loading
+# Tcl/Tk alone is a noticeable part of start-up, and importing this module
+# for its backend helpers should not pay for it.
 
 
 REPO = "git+https://github.com/Lioneltristan/chatgpfree"
@@ -16,66 +32,472 @@ PACKAGE = "chatgpt-history-mcp"
 SERVER_NAME = "ChatGPT history"
 CLAUDE_DIR = Path.home() / "Library" / "Application Support" / "Claude"
 CONFIG_PATH = CLAUDE_DIR / "claude_desktop_config.json"
+LOCK_PATH = CONFIG_PATH.with_suffix(".json.lock")
+CONFIG_WRITE_ATTEMPTS = 5
+JOURNAL_PATH = CLAUDE_DIR / ".installer_journal.jsonl"
+COPY_CHUNK_SIZE = 1 << 20
 HISTORY_DIR = CLAUDE_DIR / "chatgpt-history"
+_UVX_CANDIDATES = (
+    os.path.expanduser("~/.local/bin/uvx"),
+    os.path.expanduser("~/.cargo/bin/uvx"),
+    "/usr/local/bin/uvx",
+    "/opt/homebrew/bin/uvx",
+)
+UV_INSTALL_CMD = "set -o pipefail; curl -LsSf https://astral.sh/uv/install.sh | sh"
+UV_INSTALL_TIMEOUT = 300  # seconds
+POLL_MS = 50  # how often a running subprocess is checked
 
 
 # ---------------------------------------------------------------------------
 # Backend logic
+#
+# Long-running steps are generators: they `yield` whenever the GUI should get
+# a turn and `return` their result, so the Tk event loop can drive them with
+# `after()` on its own thread. A bare `yield` means "more work is ready";
+# yielding a number asks to be resumed after that many milliseconds (used
+# while waiting on a subprocess). `_run` drives one to completion without a GUI.
 # ---------------------------------------------------------------------------
 
-def find_uvx() -> str | None:
-    candidates = [
-        Path.home() / ".local" / "bin" / "uvx",
-        Path.home() / ".cargo" / "bin" / "uvx",
-        Path("/usr/local/bin/uvx"),
-        Path("/opt/homebrew/bin/uvx"),
-    ]
-    for p in candidates:
-        if p.exists():
-            return str(p)
+def _run(steps):
+    """Run a step generator to completion and return its result."""
+    while True:
+        try:
+            delay = next(steps)
+        except StopIteration as done:
+            return done.value
+        if delay:
+            time.sleep(delay / 1000)  # honour waits so subprocess polling doesn't spin
+
+
+def _wait_for(proc, timeout: float | None = None, log=None):
+    """Yield until Popen `proc` exits, draining its pipes; return (returncode, stdout, stderr).
+
+    `log`, if given, receives the latest stderr line as progress. On timeout
+    the whole process group is killed, so start `proc` with
+    start_new_session=True if it spawns children of its own.
+    """
+    import subprocess
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    out_fd, err_fd = proc.stdout.fileno(), proc.stderr.fileno()
+    output = {out_fd: bytearray(), err_fd: bytearray()}
+    open_fds = {out_fd, err_fd}
     try:
-        r = subprocess.run(["which", "uvx"], capture_output=True, text=True)
-        if r.returncode == 0 and r.stdout.strip():
-            return r.stdout.strip()
-    except Exception:
-        pass
-    return None
+        while open_fds or proc.poll() is None:
+            if open_fds:
+                ready, _, _ = select.select(list(open_fds), [], [], 0)
+                for fd in ready:
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        open_fds.discard(fd)
+                        continue
+                    output[fd] += chunk
+                    if log and fd == err_fd:
+                        lines = chunk.decode("utf-8", "replace").strip().splitlines()
+                        if lines:
+                            log(lines[-1])
+            if deadline is not None and time.monotonic() > deadline:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)  # the shell's curl and sh too
+                except ProcessLookupError:
+                    proc.kill()  # not a group leader
+                proc.wait()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            yield POLL_MS
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+    return (
+        proc.returncode,
+        output[out_fd].decode("utf-8", "replace"),
+        output[err_fd].decode("utf-8", "replace"),
+    )
+
+
+@lru_cache(maxsize=1)
+def find_uvx() -> str | None:
+    for candidate in _UVX_CANDIDATES:
+        if os.path.isfile(candidate):
+            return candidate
+    import shutil
+
+    return shutil.which("uvx")
 
 
 def install_uv(log):
+    import subprocess
+
     log("Downloading uv…")
-    r = subprocess.run(
-        ["curl", "-LsSf", "https://astral.sh/uv/install.sh"],
-        capture_output=True, text=True,
+    # One shell pipeline: the installer script streams from curl straight into
+    # sh. pipefail makes a failed download fail the whole command.
+    proc = subprocess.Popen(
+        UV_INSTALL_CMD, shell=True, executable="/bin/bash",
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True,
     )
-    if r.returncode != 0:
-        raise RuntimeError(f"Could not download uv installer:\n{r.stderr}")
-    r2 = subprocess.run(["sh"], input=r.stdout, capture_output=True, text=True)
-    if r2.returncode != 0:
-        raise RuntimeError(f"uv installation failed:\n{r2.stderr}")
+    try:
+        returncode, stdout, stderr = yield from _wait_for(proc, UV_INSTALL_TIMEOUT, log)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("uv installation timed out. Check your internet connection and try again.") from None
+    if returncode != 0:
+        raise RuntimeError(f"uv installation failed:\n{stderr or stdout}")
+    find_uvx.cache_clear()  # uvx exists now; forget the cached miss
     log("uv installed.")
 
 
-def copy_export(export_path: str, log) -> str:
+def _journal_append(action: str, path: Path, sha256: str, size: int, **details):
+    """Record a completed installer step as one line of the append-only journal."""
+    entry = {"ts": time.time(), "action": action, "path": str(path), "sha256": sha256, "bytes": size, **details}
+    try:
+        with open(JOURNAL_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass  # the journal only lets re-runs skip work; never fail an install over it
+
+
+def _journal_entry(action: str, **details) -> dict | None:
+    """The last journal entry for `action`, if it was recorded with these details."""
+    try:
+        lines = JOURNAL_PATH.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    for line in reversed(lines):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # torn line from an interrupted run
+        if entry.get("action") != action:
+            continue
+        if any(entry.get(k) != v for k, v in details.items()):
+            return None
+        if isinstance(entry.get("path"), str) and isinstance(entry.get("sha256"), str):
+            return entry
+        return None
+    return None
+
+
+def _journal_done(action: str, **details):
+    """Step returning True if the last `action` entry had these details and its file is still intact on disk."""
+    entry = _journal_entry(action, **details)
+    if entry is None:
+        return False
+    try:
+        h = yield from _sha256_steps(Path(entry["path"]))
+    except OSError:
+        return False
+    return h.hexdigest() == entry["sha256"]
+
+
+def _copy_file(src: Path, dest: Path):
+    """Copy src to dest (keeping its mtime) and return the SHA-256 of the copy."""
+    import subprocess
+
+    copied = False
+    if sys.platform == "darwin":
+        # APFS clone: no data is copied; fails off APFS or across volumes.
+        # The journal still needs a hash, so read the source while cp runs.
+        proc = subprocess.Popen(["cp", "-c", str(src), str(dest)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        h = yield from _sha256_steps(src)
+        returncode, _, _ = yield from _wait_for(proc)
+        copied = returncode == 0
+    if copied:
+        sha256 = h.hexdigest()
+    else:
+        # Large batches, hashing as we go so the journal needs no second read
+        h = hashlib.sha256()
+        with open(src, "rb") as fin, open(dest, "wb") as fout:
+            while chunk := fin.read(COPY_CHUNK_SIZE):
+                h.update(chunk)
+                fout.write(chunk)
+                yield
+        sha256 = h.hexdigest()
+    st = src.stat()
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return sha256
+
+
+def _export_members(path: Path) -> list[str] | None:
+    """
+    Names of the conversation files inside a ZIP export, or None for a bare JSON file.
+
+    Only the archive's central directory is read, so a wrong pick is caught
+    before any of it is copied.
+    """
+    with open(path, "rb") as f:
+        if f.read(2) != b"PK":
+            return None
+    try:
+        with zipfile.ZipFile(path) as zf:
+            names = zf.namelist()
+    except zipfile.BadZipFile:
+        raise RuntimeError("The selected file is not a valid ZIP archive.") from None
+    # Same lookup as the server: split conversations-NNN.json parts, else conversations.json
+    parts = sorted(n for n in names if re.match(r"conversations-\d+\.json", n))
+    if not parts and "conversations.json" in names:
+        parts = ["conversations.json"]
+    if not parts:
+        raise RuntimeError(
+            "No conversations.json found in the selected ZIP. "
+            "Please pick the export you downloaded from ChatGPT."
+        )
+    return parts
+
+
+def _array_body(fin, name: str):
+    """Yield the bytes of the JSON array in `fin` without its enclosing brackets."""
+    head = fin.read(COPY_CHUNK_SIZE).lstrip()
+    if not head.startswith(b"["):
+        raise RuntimeError(f"{name} in the export is not a list of conversations.")
+    pending = head[1:]
+    while chunk := fin.read(COPY_CHUNK_SIZE):
+        # Hold back the last non-blank chunk: the closing bracket is in it
+        if chunk.strip():
+            yield pending
+            pending = chunk
+        else:
+            pending += chunk
+    pending = pending.rstrip()
+    if not pending.endswith(b"]"):
+        raise RuntimeError(f"{name} in the export is truncated.")
+    yield pending[:-1]
+
+
+def _extract_members(src: Path, names: list[str], dest: Path):
+    """Stream the conversation files out of the ZIP at src into one JSON array at dest; return its SHA-256."""
+    h = hashlib.sha256()
+    with zipfile.ZipFile(src) as zf, open(dest, "wb") as fout:
+        if len(names) == 1:
+            with zf.open(names[0]) as fin:
+                while chunk := fin.read(COPY_CHUNK_SIZE):
+                    h.update(chunk)
+                    fout.write(chunk)
+                    yield
+            return h.hexdigest()
+        # Split export: splice the parts' arrays together without parsing them
+        sep = b"["
+        for name in names:
+            with zf.open(name) as fin:
+                started = False
+                for chunk in _array_body(fin, name):
+                    if not started:
+                        chunk = chunk.lstrip()
+                        if not chunk:
+                            continue  # empty part, or nothing but its opening bracket so far
+                        h.update(sep)
+                        fout.write(sep)
+                        sep = b","
+                        started = True
+                    h.update(chunk)
+                    fout.write(chunk)
+                    yield
+        if sep == b"[":
+            h.update(sep)
+            fout.write(sep)
+        h.update(b"]")
+        fout.write(b"]")
+    return h.hexdigest()
+
+
+def copy_export(export_path: str, log):
+    """Step that saves the export under HISTORY_DIR and returns the stored path."""
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
     dest = HISTORY_DIR / "conversations.json"
-    shutil.copy2(export_path, dest)
+    src = Path(export_path).resolve()
+    st = src.stat()
+    source = {"source": str(src), "source_bytes": st.st_size, "source_mtime_ns": st.st_mtime_ns}
+    # Picking the already-saved export again: copying it onto itself would truncate it
+    if dest.exists() and src.samefile(dest):
+        log("Export file already saved.")
+        return str(dest)
+    if (yield from _journal_done("copy_export", **source)):
+        log("Export file already saved.")
+        return str(dest)
+    members = _export_members(src)
+    # Copy next to dest and rename, so a failed copy never leaves a truncated export
+    tmp = dest.with_name(f"{dest.name}.tmp.{os.getpid()}")
+    tmp.unlink(missing_ok=True)  # leftover from a crashed run
+    try:
+        if members is None:
+            sha256 = yield from _copy_file(src, tmp)
+        else:
+            # The server only reads the conversations, not the images and audio around them
+            sha256 = yield from _extract_members(src, members, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _journal_append("copy_export", dest, sha256, dest.stat().st_size, **source)
     log("Export file saved.")
     return str(dest)
 
 
+def _sha256_steps(path: Path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            h.update(chunk)
+            yield
+    return h
+
+
+def _sha256_file(path: Path):
+    return _run(_sha256_steps(path))
+
+
+def _file_sha(path: Path) -> str:
+    try:
+        return _sha256_file(path).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def _atomic_write(path: Path, data: bytes, if_sha: str | None = None) -> os.stat_result | None:
+    """Replace `path` with `data` so readers see either the old or the new file, never a partial one.
+
+    Returns the stat of the new file, taken before it went live. With
+    `if_sha`, the replace only happens if `path` still hashes to it ("" for
+    a missing file); returns None without touching `path` otherwise.
+    A symlinked `path` is written through to its target, keeping the link,
+    and an existing file's permissions carry over to the new one.
+    """
+    path = path.resolve()
+    expected = hashlib.sha256(data).digest()
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    tmp.unlink(missing_ok=True)  # leftover from a crashed run
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            try:
+                # e.g. a 0600 config holding other servers' secrets stays 0600
+                os.fchmod(f.fileno(), stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        # Read the temp file back before it goes live: a short write
+        # (e.g. disk full) must never replace a good config.
+        if _sha256_file(tmp).digest() != expected:
+            raise RuntimeError(f"write_corruption: {path.name} did not read back as written")
+        # Checked last, so nothing slow sits between the check and the rename
+        if if_sha is not None and _file_sha(path) != if_sha:
+            tmp.unlink()
+            return None
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return st
+
+
+def _config_lock(log):
+    """Step that takes the exclusive lock for a config read-modify-write and returns its fd.
+
+    The lock lives on a separate file: the config itself is replaced by
+    rename, so its inode (and any lock on it) changes on every write.
+    It is polled rather than waited on, so the GUI stays responsive while
+    another installer holds it. Closing the fd releases it.
+    """
+    fd = os.open(LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                if not waiting:
+                    log("Waiting for another installer to finish…")
+                    waiting = True
+                yield POLL_MS
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+# (inode, size, mtime_ns) of the config file -> (sha256, parsed config)
+_config_cache: tuple[tuple[int, int, int], str, dict] | None = None
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _read_config(use_cache: bool = True) -> tuple[dict, str]:
+    """Return the current config and the SHA-256 of its bytes ("" if there is none).
+
+    The parse is reused while the file's inode, size and mtime are unchanged,
+    unless `use_cache` is False.
+    """
+    global _config_cache
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            key = _stat_key(os.fstat(f.fileno()))
+            if use_cache and _config_cache is not None and _config_cache[0] == key:
+                return copy.deepcopy(_config_cache[2]), _config_cache[1]
+            raw = f.read()
+    except FileNotFoundError:
+        return {}, ""
+    try:
+        config = json.loads(raw)
+    except ValueError:
+        config = {}
+    sha = hashlib.sha256(raw).hexdigest()
+    _config_cache = (key, sha, copy.deepcopy(config))
+    return config, sha
+
+
+def _dumps(obj) -> bytes:
+    """Serialize `obj` as indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def write_config(stored_path: str, uvx_path: str, log):
-    config: dict = {}
-    if CONFIG_PATH.exists():
-        try:
-            config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            pass
-    config.setdefault("mcpServers", {})[SERVER_NAME] = {
-        "command": uvx_path,
-        "args": ["--from", REPO, PACKAGE, "--export-path", stored_path],
-    }
-    CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    """Step that points Claude Desktop's config at the stored export."""
+    global _config_cache
+    lock_fd = yield from _config_lock(log)
+    try:
+        if (yield from _journal_done("write_config", command=uvx_path, export_path=stored_path)):
+            log("Claude Desktop config already up to date.")
+            return
+        # Claude Desktop doesn't take our lock, so check the file is still
+        # the one we merged into right before replacing it; if not, merge again.
+        for attempt in range(CONFIG_WRITE_ATTEMPTS):
+            # A retry means the file changed under us. An in-place rewrite can
+            # keep inode, size and (on coarse clocks) mtime, so read it for real.
+            config, prev_sha = _read_config(use_cache=attempt == 0)
+            config.setdefault("mcpServers", {})[SERVER_NAME] = {
+                "command": uvx_path,
+                "args": ["--from", REPO, PACKAGE, "--export-path", stored_path],
+            }
+            data = _dumps(config)
+            st = _atomic_write(CONFIG_PATH, data, if_sha=prev_sha)
+            if st is not None:
+                sha = hashlib.sha256(data).hexdigest()
+                # Keyed on the file we wrote, not a stat after the rename that
+                # could already see another writer's file
+                _config_cache = (_stat_key(st), sha, config)
+                _journal_append(
+                    "write_config", CONFIG_PATH, sha, len(data),
+                    command=uvx_path, export_path=stored_path,
+                )
+                break
+            yield
+        else:
+            raise RuntimeError(
+                "Claude Desktop config kept changing while it was being updated "
+                "(stale_precondition). Quit Claude Desktop and try again."
+            )
+    finally:
+        os.close(lock_fd)  # releases the lock
     log("Claude Desktop config updated.")
 
 
@@ -84,6 +506,7 @@ def write_config(stored_path: str, uvx_path: str, log):
 # ---------------------------------------------------------------------------
 
 W           = 460
+H           = 580
 BG          = "#ffffff"
 BG2         = "#f5f5f7"
 HEADER_BG   = "#1d1d1f"
@@ -113,25 +536,35 @@ F_MONO      = ("Menlo", 11)
 # GUI
 # ---------------------------------------------------------------------------
 
-class InstallerApp(tk.Tk):
+class InstallerApp:
     def __init__(self):
-        super().__init__()
-        self.title("ChatGPT History for Claude")
-        self.resizable(False, False)
-        self.configure(bg=BG)
+        import tkinter as tk
+
+        self.root = tk.Tk()
+        self.root.title("ChatGPT History for Claude")
+        self.root.resizable(False, False)
+        self.root.configure(bg=BG)
         self.selected_path: str | None = None
+        self._steps = None  # running install, advanced by _pump
+        # Build and lay out the window hidden, so it is mapped once at its
+        # final size and position instead of growing as widgets are packed.
+        self.root.withdraw()
         self._build_ui()
-        self.update_idletasks()
-        w = self.winfo_width()
-        h = self.winfo_height()
-        sw = self.winfo_screenwidth()
-        sh = self.winfo_screenheight()
-        self.geometry(f"+{(sw - w) // 2}+{(sh - h) // 2}")
+        self.root.update_idletasks()
+        # A never-mapped window reports a 1x1 size, so center on the size we set
+        sw = self.root.winfo_screenwidth()
+        sh = self.root.winfo_screenheight()
+        self.root.geometry(f"{W}x{H}+{(sw - W) // 2}+{(sh - H) // 2}")
+        self.root.deiconify()
+
+    def mainloop(self):
+        self.root.mainloop()
 
     def _build_ui(self):
+        import tkinter as tk
 
         # ── Header ───────────────────────────────────────────────────────────
-        hdr = tk.Frame(self, bg=HEADER_BG)
+        hdr = tk.Frame(self.root, bg=HEADER_BG)
         hdr.pack(fill="x")
 
         tk.Label(
@@ -151,7 +584,7 @@ class InstallerApp(tk.Tk):
         ).pack(pady=(6, 28))
 
         # ── Body ─────────────────────────────────────────────────────────────
-        body = tk.Frame(self, bg=BG, padx=28, pady=24)
+        body = tk.Frame(self.root, bg=BG, padx=28, pady=24)
         body.pack(fill="both")
 
         # Section label
@@ -208,7 +641,7 @@ class InstallerApp(tk.Tk):
         self.install_btn.pack(fill="x")
 
         # ── Status ────────────────────────────────────────────────────────────
-        self.status_var = tk.StringVar(value="")
+        self.status_var = tk.StringVar(self.root, value="")
         self._status_lbl = tk.Label(
             body, textvariable=self.status_var,
             font=F_MONO, fg=TEXT2, bg=BG,
@@ -216,11 +649,11 @@ class InstallerApp(tk.Tk):
         )
         self._status_lbl.pack(fill="x", pady=(14, 0))
 
-        self.geometry(f"{W}x580")
-
     # ── Interactions ──────────────────────────────────────────────────────────
 
     def _pick_file(self):
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select your ChatGPT export",
             filetypes=[("ChatGPT export", "*.zip *.json"), ("All files", "*.*")],
@@ -231,6 +664,8 @@ class InstallerApp(tk.Tk):
             self._file_lbl.config(text=f"  {name}", fg=TEXT1)
 
     def _start_install(self):
+        from tkinter import messagebox
+
         if not self.selected_path:
             messagebox.showwarning(
                 "No file selected",
@@ -238,17 +673,26 @@ class InstallerApp(tk.Tk):
             )
             return
         self.install_btn.config(state="disabled", text="Setting up…", bg=BTN2_BG, fg=BTN2_FG)
-        threading.Thread(target=self._install, daemon=True).start()
+        self._steps = self._install()
+        self.root.after(0, self._pump)
+
+    def _pump(self):
+        # Advance the install by one step, then let Tk handle pending events
+        try:
+            delay = next(self._steps)
+        except StopIteration:
+            return
+        self.root.after(delay or 1, self._pump)
 
     def _log(self, msg: str):
-        self.after(0, lambda m=msg: self.status_var.set(m))
+        self.status_var.set(msg)
 
     def _install(self):
         try:
             self._log("Looking for uv…")
             uvx = find_uvx()
             if not uvx:
-                install_uv(self._log)
+                yield from install_uv(self._log)
                 uvx = find_uvx()
                 if not uvx:
                     raise RuntimeError(
@@ -257,20 +701,20 @@ class InstallerApp(tk.Tk):
                     )
 
             self._log("Saving your export file…")
-            stored = copy_export(self.selected_path, self._log)
+            stored = yield from copy_export(self.selected_path, self._log)
 
             self._log("Updating Claude Desktop…")
-            write_config(stored, uvx, self._log)
+            yield from write_config(stored, uvx, self._log)
 
             self._log("All done — restart Claude Desktop to activate.")
-            self.after(0, lambda: self.install_btn.config(
+            self.install_btn.config(
                 text="✓  Setup complete", bg=SUCCESS_BG, fg=BTN_FG, state="disabled",
-            ))
+            )
         except Exception as exc:
             self._log(f"Error: {exc}")
-            self.after(0, lambda: self.install_btn.config(
+            self.install_btn.config(
                 text="Try again", bg=ERROR_BG, fg=BTN_FG, state="normal",
-            ))
+            )
 
 
 def main():